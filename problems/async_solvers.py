@@ -0,0 +1,239 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from knapsack_01 import solve_knapsack_01
+from longest_common_subsequence import longest_common_subsequence_tabulation
+
+# --- Async Solvers: DP inside an asyncio program ---
+# A big tabulation can take seconds. Calling it directly from a coroutine freezes
+# the whole event loop for that long, and there is no way to stop it halfway.
+#
+# The wrappers below:
+#   1. Run the solver in a worker thread, so the event loop stays responsive.
+#   2. Stop it when the deadline passes or the calling task is cancelled. The
+#      solver checks a "stop" flag after every row of its DP table (a cooperative
+#      checkpoint), so it stops within one row.
+#   3. On a deadline, return the best answer the finished rows already give:
+#        - Knapsack: dp_table[i][capacity] is the best value using the first i
+#          items, which is a real packing, just maybe not the best one.
+#        - LCS: dp[i][n] is the LCS of the first i characters of s1 with s2,
+#          a lower bound on the final length.
+#
+# Use it like this:
+#   result = await solve_knapsack_01_async(weights, values, capacity, timeout=0.5)
+#   if not result.complete:
+#       print(f"Ran out of time, best so far: {result.value}")
+
+
+class AsyncSolveResult(NamedTuple):
+    """
+    The outcome of an async solve.
+
+    value: The answer if `complete` is True, otherwise the best partial answer.
+    complete: True if the solver finished before the deadline.
+    rows_done: How many rows of the DP table were filled.
+    rows_total: How many rows the full table has.
+    """
+    value: int
+    complete: bool
+    rows_done: int
+    rows_total: int
+
+
+class _SolveStopped(Exception):
+    """Raised at a row checkpoint to unwind the solver once it has been asked to stop."""
+
+
+# Used when the caller doesn't pass an executor. We submit to it directly (rather than
+# through `loop.run_in_executor`) so a solve still waiting in the queue can be cancelled.
+_default_executor: Optional[ThreadPoolExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(thread_name_prefix="dpx-async-solver")
+        return _default_executor
+
+
+def _retrieve_exception(future: "asyncio.Future[Any]") -> None:
+    # A stopped solver ends with `_SolveStopped` that nobody may await (for example
+    # after the caller was cancelled). Reading it here keeps asyncio from warning
+    # "exception was never retrieved".
+    if not future.cancelled():
+        future.exception()
+
+
+async def _run_with_checkpoints(
+    solve: Callable[[Callable[[int, List[int]], None]], int],
+    rows_total: int,
+    timeout: Optional[float],
+    executor: Optional[ThreadPoolExecutor],
+) -> AsyncSolveResult:
+    """
+    Runs `solve(row_checkpoint)` in a thread and enforces the deadline.
+    The last entry of each finished row is remembered as the partial answer.
+    """
+    stop = threading.Event()
+    # Written by the worker thread, read by the event loop after the thread stops.
+    progress: Dict[str, int] = {"rows_done": 0, "best": 0}
+    not_started = AsyncSolveResult(0, False, 0, rows_total)
+
+    def row_checkpoint(row_index: int, row: List[int]) -> None:
+        progress["rows_done"] = row_index
+        progress["best"] = row[-1]
+        if stop.is_set():
+            raise _SolveStopped()
+
+    def run() -> int:
+        # One check before the solver builds its DP table, which can take a while
+        # on its own: a solve picked up just after its deadline stops right here.
+        if stop.is_set():
+            raise _SolveStopped()
+        return solve(row_checkpoint)
+
+    job: "Future[int]" = (executor or _get_default_executor()).submit(run)
+    future = asyncio.wrap_future(job)
+    # The asyncio wrapper is the one that warns about an unretrieved exception.
+    future.add_done_callback(_retrieve_exception)
+
+    try:
+        # Unlike `asyncio.wait_for`, `asyncio.wait` never cancels the future itself.
+        # That doesn't matter for a thread (it can't be interrupted from outside),
+        # but it lets us collect the partial result after the timeout.
+        done, _ = await asyncio.wait({future}, timeout=timeout)
+    except asyncio.CancelledError:
+        # The caller went away (e.g. the client disconnected). A solve still in the
+        # queue is dropped; a running one stops at its next row so the thread is freed.
+        stop.set()
+        job.cancel()
+        raise
+
+    if future not in done:
+        stop.set()
+        if job.cancel():
+            # It never got a thread (the executor was busy), so there's no progress to report.
+            return not_started
+        try:
+            # The solver notices the flag at the end of its current row.
+            value: int = await future
+        except _SolveStopped:
+            # Stopped at the very last row's checkpoint: that row holds the full answer.
+            complete: bool = progress["rows_done"] == rows_total
+            return AsyncSolveResult(progress["best"], complete, progress["rows_done"], rows_total)
+        # It finished the last row just as the deadline passed.
+        return AsyncSolveResult(value, True, rows_total, rows_total)
+
+    return AsyncSolveResult(future.result(), True, rows_total, rows_total)
+
+
+async def solve_knapsack_01_async(
+    item_weights: List[int],
+    item_values: List[int],
+    knapsack_capacity: int,
+    timeout: Optional[float] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> AsyncSolveResult:
+    """
+    Solves the 0/1 Knapsack problem without blocking the event loop.
+
+    Args:
+        item_weights: A list of integers representing the weights of the items.
+        item_values: A list of integers representing the values of the items.
+        knapsack_capacity: An integer representing the maximum weight the knapsack can hold.
+        timeout: Deadline in seconds from now, or None to wait for the full answer.
+        executor: Thread pool to run the solver in (defaults to a thread pool shared by this module).
+                  It must be a thread pool: the stop flag is shared memory.
+
+    Returns:
+        An AsyncSolveResult. If the deadline hit, `value` is the best total value
+        found using only the first `rows_done` items.
+
+    Raises:
+        ValueError: If the weights and values lists differ in length, or the
+                    capacity is negative.
+    """
+    # `solve_knapsack_01` prints a message and returns 0 for mismatched lists, which
+    # would come back here as a "complete" wrong answer, so reject bad input up front.
+    if len(item_weights) != len(item_values):
+        raise ValueError("item_weights and item_values must have the same number of items")
+    if knapsack_capacity < 0:
+        raise ValueError("knapsack_capacity must not be negative")
+
+    def solve(row_checkpoint: Callable[[int, List[int]], None]) -> int:
+        return solve_knapsack_01(item_weights, item_values, knapsack_capacity, row_checkpoint=row_checkpoint)
+
+    return await _run_with_checkpoints(solve, len(item_values), timeout, executor)
+
+
+async def longest_common_subsequence_async(
+    s1: str,
+    s2: str,
+    timeout: Optional[float] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> AsyncSolveResult:
+    """
+    Calculates the length of the Longest Common Subsequence without blocking the event loop.
+
+    Args:
+        s1: The first string.
+        s2: The second string.
+        timeout: Deadline in seconds from now, or None to wait for the full answer.
+        executor: Thread pool to run the solver in (defaults to a thread pool shared by this module).
+                  It must be a thread pool: the stop flag is shared memory.
+
+    Returns:
+        An AsyncSolveResult. If the deadline hit, `value` is the LCS length of the
+        first `rows_done` characters of s1 with s2, a lower bound on the answer.
+    """
+    def solve(row_checkpoint: Callable[[int, List[int]], None]) -> int:
+        return longest_common_subsequence_tabulation(s1, s2, row_checkpoint=row_checkpoint)
+
+    return await _run_with_checkpoints(solve, len(s1), timeout, executor)
+
+
+# ======================================================================================
+# Example
+# ======================================================================================
+if __name__ == "__main__":
+    import time
+
+    async def main() -> None:
+        print("--- Async Solvers ---")
+
+        # A small instance finishes well before its deadline.
+        result = await solve_knapsack_01_async([10, 20, 30], [60, 100, 120], 50, timeout=5)
+        print(f"\nSmall knapsack: {result}")
+        assert result == AsyncSolveResult(220, True, 3, 3)
+
+        # A big LCS with a short deadline returns a lower bound instead.
+        s1, s2 = "ACGT" * 500, "TGCA" * 500
+        start = time.perf_counter()
+        result = await longest_common_subsequence_async(s1, s2, timeout=0.5)
+        print(f"Big LCS after {time.perf_counter() - start:.2f}s: {result}")
+        assert not result.complete and result.rows_done < result.rows_total
+
+        # Meanwhile the event loop keeps running other tasks.
+        ticks: List[int] = []
+
+        async def ticker() -> None:
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        solve_task = asyncio.create_task(longest_common_subsequence_async(s1, s2))
+        await asyncio.sleep(0.2)
+        solve_task.cancel()  # e.g. the client disconnected
+        try:
+            await solve_task
+        except asyncio.CancelledError:
+            print(f"Cancelled a running LCS; the event loop ticked {len(ticks)} times meanwhile")
+        ticker_task.cancel()
+
+    asyncio.run(main())
+    print("\nAsync solver examples finished successfully!")
@@ -0,0 +1,416 @@
+import argparse
+import json
+import os
+import signal
+import sys
+from collections import deque
+from itertools import chain
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+from fibonacci import fibonacci_with_tabulation
+from knapsack_01 import solve_knapsack_01
+from longest_common_subsequence import longest_common_subsequence_tabulation
+from longest_increasing_subsequence import longest_increasing_subsequence_optimized_nlogn
+from result_cache import ResultCache, make_cache_key
+
+# `signal.setitimer` and the `resource` module only exist on Unix-like systems.
+# On other platforms the time and memory limits are simply not enforced.
+_HAS_TIMERS: bool = hasattr(signal, "setitimer")
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+# --- Batch Solver: many problem instances, many CPU cores ---
+# Every problem module in this folder solves ONE instance per function call.
+# When you have millions of instances, you want to:
+#   1. Read them as a stream (one JSON object per line, "JSONL"),
+#   2. Hand them out in chunks to a pool of worker processes (one per core),
+#   3. Write the answers back as a stream, without holding everything in memory.
+#
+# Input line examples:
+#   {"id": "a", "problem": "knapsack_01", "item_weights": [10, 20, 30], "item_values": [60, 100, 120], "knapsack_capacity": 50}
+#   {"id": "b", "problem": "lcs", "s1": "AGGTAB", "s2": "GXTXAYB"}
+#   {"id": "c", "problem": "lis", "nums": [10, 9, 2, 5, 3, 7, 101, 18]}
+#   {"id": "d", "problem": "fibonacci", "number": 30}
+#
+# Output line examples:
+#   {"index": 0, "id": "a", "problem": "knapsack_01", "result": 220}
+#   {"index": 1, "id": "b", "problem": "lcs", "error": "TimeLimitExceeded: ..."}
+#
+# Run it with:
+#   python problems/batch_solver.py instances.jsonl > results.jsonl
+#   cat instances.jsonl | python problems/batch_solver.py --unordered --time-limit 2
+#   python problems/batch_solver.py --cache results.sqlite3 instances.jsonl
+
+# ======================================================================================
+# Problem Registry
+# ======================================================================================
+
+def _solve_knapsack_instance(instance: Dict[str, Any]) -> int:
+    item_weights: List[int] = instance["item_weights"]
+    item_values: List[int] = instance["item_values"]
+    # `solve_knapsack_01` prints a message and returns 0 on mismatched lists,
+    # which would look like a valid answer in the output. Report it as an error instead.
+    if len(item_weights) != len(item_values):
+        raise ValueError("item_weights and item_values must have the same number of items")
+    return solve_knapsack_01(item_weights, item_values, instance["knapsack_capacity"])
+
+
+def _solve_lcs_instance(instance: Dict[str, Any]) -> int:
+    return longest_common_subsequence_tabulation(instance["s1"], instance["s2"])
+
+
+def _solve_lis_instance(instance: Dict[str, Any]) -> int:
+    return longest_increasing_subsequence_optimized_nlogn(instance["nums"])
+
+
+def _solve_fibonacci_instance(instance: Dict[str, Any]) -> int:
+    return fibonacci_with_tabulation(instance["number"])
+
+
+# Maps the "problem" field of an input line to the function that solves it.
+SOLVERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "knapsack_01": _solve_knapsack_instance,
+    "lcs": _solve_lcs_instance,
+    "lis": _solve_lis_instance,
+    "fibonacci": _solve_fibonacci_instance,
+}
+
+# Part of every result-cache key. Bump a solver's version whenever its answers
+# could change, so results cached by the old code are no longer used.
+SOLVER_VERSIONS: Dict[str, str] = {
+    "knapsack_01": "1",
+    "lcs": "1",
+    "lis": "1",
+    "fibonacci": "1",
+}
+
+# The fields of an input line each solver reads. Only these go into cache keys,
+# so extra metadata on a line (a tag, a timestamp) doesn't stop a cache hit.
+SOLVER_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "knapsack_01": ("item_weights", "item_values", "knapsack_capacity"),
+    "lcs": ("s1", "s2"),
+    "lis": ("nums",),
+    "fibonacci": ("number",),
+}
+
+# ======================================================================================
+# Worker Side (runs inside each pool process)
+# ======================================================================================
+
+class TimeLimitExceeded(Exception):
+    """Raised inside a worker when one instance runs longer than `--time-limit`."""
+
+
+# Per-worker settings, filled in by `_init_worker` when the pool starts the process.
+_worker_time_limit: Optional[float] = None
+_worker_cache: Optional[ResultCache] = None
+
+
+def _raise_time_limit(signum: int, frame: Any) -> None:
+    raise TimeLimitExceeded(f"instance exceeded the time limit of {_worker_time_limit}s")
+
+
+def _current_address_space_bytes() -> int:
+    """
+    Returns the virtual memory size of this process (Linux only, 0 elsewhere).
+    The memory limit is added on top of it, so the interpreter itself is not counted.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            total_pages: int = int(statm.read().split()[0])
+        return total_pages * resource.getpagesize()
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _allow_big_ints() -> None:
+    """
+    Python 3.11+ refuses to convert integers over 4300 digits to or from text by default.
+    Answers like Fibonacci(30000) are that big, and they have to go through JSON.
+    """
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
+
+
+def _init_worker(
+    time_limit: Optional[float],
+    memory_limit_mb: Optional[int],
+    cache_path: Optional[str],
+    cache_max_bytes: int,
+) -> None:
+    """
+    Runs once in every worker process before it receives any work.
+    """
+    global _worker_time_limit, _worker_cache
+    _worker_time_limit = time_limit
+    _allow_big_ints()
+    if cache_path is not None:
+        # Every worker opens its own connection to the shared cache file.
+        _worker_cache = ResultCache(cache_path, max_bytes=cache_max_bytes)
+
+    if time_limit is not None and _HAS_TIMERS:
+        signal.signal(signal.SIGALRM, _raise_time_limit)
+
+    if memory_limit_mb is not None and resource is not None:
+        # A worker solves one instance at a time, so capping the worker's address space
+        # caps each instance. Going over it raises MemoryError in the DP table allocation,
+        # the half-built table is freed, and the worker carries on with the next instance.
+        limit_bytes: int = _current_address_space_bytes() + memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+
+
+def _solve_one(index: int, line: str) -> Dict[str, Any]:
+    """
+    Parses and solves a single input line, always returning an output record.
+    A bad line never takes down the whole batch; it just gets an "error" field.
+    """
+    record: Dict[str, Any] = {"index": index}
+    try:
+        instance = json.loads(line)
+        if not isinstance(instance, dict):
+            raise ValueError("each line must be a JSON object")
+        if "id" in instance:
+            record["id"] = instance["id"]
+        problem = instance.get("problem")
+        record["problem"] = problem
+        solver = SOLVERS.get(problem)
+        if solver is None:
+            raise ValueError(f"unknown problem {problem!r}, expected one of {sorted(SOLVERS)}")
+
+        cache_key: Optional[str] = None
+        cached: Any = None
+        if _worker_cache is not None:
+            try:
+                inputs = {field: instance[field] for field in SOLVER_INPUTS[problem]}
+                cache_key = make_cache_key(problem, SOLVER_VERSIONS[problem], inputs)
+                cached = _worker_cache.get(cache_key)
+            except Exception:
+                # The cache is optional: if the key can't be built (missing field) or
+                # the cache can't be read (locked too long, disk full, corrupt file),
+                # just solve the instance as if the cache weren't there.
+                cached = None
+            if cached is not None:
+                record["result"] = cached
+                return record
+
+        if _worker_time_limit is not None and _HAS_TIMERS:
+            signal.setitimer(signal.ITIMER_REAL, _worker_time_limit)
+        try:
+            result = solver(instance)
+        finally:
+            if _worker_time_limit is not None and _HAS_TIMERS:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        # Only store the result once the timer is disarmed: an alarm arriving between
+        # the solver returning and the `finally` must not leave both "result" and "error".
+        record["result"] = result
+
+        # Only successful results are cached; errors may depend on the limits in use.
+        if cache_key is not None:
+            try:
+                _worker_cache.put(cache_key, result)
+            except Exception:
+                pass  # Not storing it only costs a re-solve next time; the answer stands.
+    except TimeLimitExceeded as error:
+        record["error"] = f"TimeLimitExceeded: {error}"
+    except MemoryError:
+        record["error"] = "MemoryLimitExceeded: instance needed more memory than --memory-limit allows"
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+    return record
+
+
+def _solve_chunk(chunk: List[Tuple[int, str]]) -> List[Dict[str, Any]]:
+    """
+    The unit of work sent to a pool process. Sending many instances at once
+    keeps the cost of inter-process communication small compared to the solving.
+    """
+    return [_solve_one(index, line) for index, line in chunk]
+
+# ======================================================================================
+# Parent Side (reads input, feeds the pool, writes output)
+# ======================================================================================
+
+def _read_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    """
+    Groups non-empty input lines into lists of `(input_index, line)` pairs.
+    Lines are read lazily, so a huge input file is never loaded all at once.
+    """
+    chunk: List[Tuple[int, str]] = []
+    index: int = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        chunk.append((index, line))
+        index += 1
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def solve_stream(
+    lines: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+    max_pending_chunks: Optional[int] = None,
+    ordered: bool = True,
+    time_limit: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+    cache_path: Optional[str] = None,
+    cache_max_bytes: int = 256 * 1024 * 1024,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Solves a stream of JSONL problem instances on a process pool.
+
+    Args:
+        lines: Any iterable of JSON lines (an open file, sys.stdin, a list of strings).
+        workers: Number of worker processes (defaults to the number of CPU cores).
+        chunk_size: How many instances are sent to a worker in one go.
+        max_pending_chunks: At most this many chunks are in flight at once. Reading
+                            input pauses until a chunk finishes (backpressure), so
+                            memory stays bounded no matter how long the input is.
+                            Defaults to twice the number of workers.
+        ordered: If True, results come out in input order. If False, results come
+                 out as soon as their chunk finishes, which keeps all workers busy
+                 even when one chunk is slow.
+        time_limit: Per-instance wall-clock limit in seconds (Unix only).
+        memory_limit_mb: Per-instance memory limit in megabytes (Unix only).
+        cache_path: Optional SQLite file for a persistent result cache shared by all
+                    workers (see result_cache.py). Instances already in the cache
+                    are answered with one lookup instead of being solved again.
+        cache_max_bytes: Size budget of the result cache.
+
+    Yields:
+        One output record (a dict) per input line.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending_chunks is None:
+        max_pending_chunks = 2 * workers
+    max_pending_chunks = max(1, max_pending_chunks)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(time_limit, memory_limit_mb, cache_path, cache_max_bytes),
+    ) as pool:
+        # A queue in submission order (ordered mode) or a set of running chunks (unordered).
+        queue: Deque[Future] = deque()
+        pending: Set[Future] = set()
+        try:
+            if ordered:
+                # We always wait for the OLDEST chunk, so results are written
+                # in exactly the order they were read.
+                for chunk in _read_chunks(lines, chunk_size):
+                    if len(queue) >= max_pending_chunks:
+                        yield from queue.popleft().result()
+                    queue.append(pool.submit(_solve_chunk, chunk))
+                while queue:
+                    yield from queue.popleft().result()
+            else:
+                # We wait for WHICHEVER chunk finishes first.
+                for chunk in _read_chunks(lines, chunk_size):
+                    if len(pending) >= max_pending_chunks:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield from future.result()
+                    pending.add(pool.submit(_solve_chunk, chunk))
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+        finally:
+            # If the caller stops early (e.g. the generator is closed after a broken
+            # pipe), drop the chunks no worker has started on yet. Otherwise leaving
+            # the `with` block would wait for all of them to be solved for nothing.
+            for future in chain(queue, pending):
+                future.cancel()
+
+
+def _input_lines(paths: List[str]) -> Iterator[str]:
+    """
+    Yields lines from each path in turn. "-" (or no paths at all) means stdin.
+    """
+    for path in paths or ["-"]:
+        if path == "-":
+            yield from sys.stdin
+        else:
+            with open(path, encoding="utf-8") as input_file:
+                yield from input_file
+
+
+def main(argv: Optional[List[str]] = None, output: TextIO = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(
+        description="Solve JSONL problem instances (knapsack_01, lcs, lis, fibonacci) on a process pool."
+    )
+    parser.add_argument("inputs", nargs="*", help="JSONL files to read ('-' or nothing for stdin)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="instances per chunk sent to a worker")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="chunks in flight before input reading pauses (default: 2 x workers)")
+    parser.add_argument("--unordered", action="store_true",
+                        help="write results as soon as they are ready instead of in input order")
+    parser.add_argument("--time-limit", type=float, default=None, help="seconds allowed per instance")
+    parser.add_argument("--memory-limit", type=int, default=None, help="megabytes allowed per instance")
+    parser.add_argument("--cache", default=None, metavar="PATH",
+                        help="SQLite file used as a persistent result cache (created if missing)")
+    parser.add_argument("--cache-max-mb", type=int, default=256, help="size budget of the result cache in megabytes")
+    args = parser.parse_args(argv)
+
+    for path in args.inputs:
+        if path != "-" and not os.path.isfile(path):
+            parser.error(f"input file not found: {path}")
+
+    # Catch bad values here, as usage errors, rather than as tracebacks from the pool.
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if args.max_pending is not None and args.max_pending < 1:
+        parser.error("--max-pending must be at least 1")
+    if args.time_limit is not None and args.time_limit <= 0:
+        parser.error("--time-limit must be positive")
+    if args.memory_limit is not None and args.memory_limit < 1:
+        parser.error("--memory-limit must be at least 1")
+    if args.cache_max_mb < 1:
+        parser.error("--cache-max-mb must be at least 1")
+
+    _allow_big_ints()
+    records = solve_stream(
+        _input_lines(args.inputs),
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_pending_chunks=args.max_pending,
+        ordered=not args.unordered,
+        time_limit=args.time_limit,
+        memory_limit_mb=args.memory_limit,
+        cache_path=args.cache,
+        cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+    )
+    try:
+        for record in records:
+            output.write(json.dumps(record) + "\n")
+            # Flushing per record keeps the output streaming for whoever reads our stdout.
+            output.flush()
+    except BrokenPipeError:
+        # Whoever reads our output (e.g. `head`) stopped reading. Shut the pool down and
+        # point stdout at /dev/null, so Python's final flush doesn't complain either.
+        records.close()
+        if output is sys.stdout:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
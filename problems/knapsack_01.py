@@ -1,4 +1,8 @@
-def solve_knapsack_01(item_weights, item_values, knapsack_capacity):
+# How often (in columns) `solve_knapsack_01` calls `row_checkpoint` inside a row.
+_COLUMNS_PER_CHECKPOINT = 65536
+
+
+def solve_knapsack_01(item_weights, item_values, knapsack_capacity, row_checkpoint=None):
     """
     Solves the 0/1 Knapsack problem using bottom-up dynamic programming (tabulation).
 
@@ -6,6 +10,12 @@ def solve_knapsack_01(item_weights, item_values, knapsack_capacity):
         item_weights: A list of integers representing the weights of the items.
         item_values: A list of integers representing the values of the items.
         knapsack_capacity: An integer representing the maximum weight the knapsack can hold.
+        row_checkpoint: Optional function called as `row_checkpoint(i, dp_table[i])` after
+                        each row of the table is filled. `dp_table[i][knapsack_capacity]`
+                        is the best value using only the first `i` items, so the caller
+                        can watch progress, or raise an exception to stop early.
+                        Very wide rows also call it part-way through, with the last
+                        finished row.
 
     Returns:
         The maximum total value of items that can be put into the knapsack.
@@ -37,7 +47,10 @@ def solve_knapsack_01(item_weights, item_values, knapsack_capacity):
 
     # Initialize the table with all zeros.
     # This means, initially, we assume we can get 0 value.
-    dp_table = [[0 for _ in range(knapsack_capacity + 1)] for _ in range(num_items + 1)]
+    # We start with just row 0 and add each next row right before filling it, so a
+    # huge table isn't built up front (and `row_checkpoint` is reached right away).
+    # `[0] * size` builds a row in one fast step.
+    dp_table = [[0] * (knapsack_capacity + 1)]
 
     # --- Filling the DP Table (The Core Logic) ---
     # We'll iterate through each item, and for each item, we'll consider all possible knapsack capacities.
@@ -45,6 +58,9 @@ def solve_knapsack_01(item_weights, item_values, knapsack_capacity):
     # `i` will go from 1 up to `num_items`.
     # This `i` represents "considering the i-th item" (which is at index `i-1` in our lists).
     for i in range(1, num_items + 1):
+        # Add row `i`, all zeros for now; the loop below fills it in.
+        dp_table.append([0] * (knapsack_capacity + 1))
+
         # Get the weight and value of the *current* item we are considering.
         # Since our `i` is 1-based for the table (1st item, 2nd item, etc.),
         # the actual index in our 0-based `item_weights` and `item_values` lists is `i-1`.
@@ -76,6 +92,15 @@ def solve_knapsack_01(item_weights, item_values, knapsack_capacity):
             # So, `dp_table[i][w]` should be the maximum of these two choices.
             dp_table[i][current_weight_capacity] = max(value_without_current_item, value_with_current_item)
 
+            # A row as wide as a huge capacity takes a while to fill, so every
+            # `_COLUMNS_PER_CHECKPOINT` columns we also report the last *finished* row, `i - 1`.
+            if row_checkpoint is not None and current_weight_capacity % _COLUMNS_PER_CHECKPOINT == 0:
+                row_checkpoint(i - 1, dp_table[i - 1])
+
+        # Row `i` is finished: a good moment to report progress (see async_solvers.py).
+        if row_checkpoint is not None:
+            row_checkpoint(i, dp_table[i])
+
     # --- The Final Answer ---
     # After filling the whole table, the cell `dp_table[num_items][knapsack_capacity]`
     # will contain the maximum value we can get by considering all `num_items`
@@ -0,0 +1,316 @@
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+# NumPy is optional. Without it everything still works, just on plain lists.
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+# --- Batched Longest Increasing Subsequence ---
+# `longest_increasing_subsequence_optimized_nlogn` handles ONE sequence, and its
+# binary search runs one Python step at a time. When you need LIS lengths for
+# hundreds of thousands of sequences, two things help:
+#
+#   1. Without NumPy: use `bisect.bisect_left` (written in C) for the binary search.
+#      It finds exactly the same spot: the first tail that is >= the new number.
+#
+#   2. With NumPy: run the SAME patience-sorting algorithm on many sequences at
+#      once. Step `t` handles the `t`-th number of every sequence together: each
+#      sequence keeps its `tails` list in its own slice of one big array, and one
+#      vectorized binary search finds the insertion point in every slice at once.
+#      That only pays off with many sequences running side by side; when few are
+#      left (say, one long outlier series), they are finished with `bisect`.
+#
+# Either way, the answers are identical to the per-sequence function.
+#
+# Input can be:
+#   - a list of lists:          lis_lengths_batch([[10, 9, 2, 5], [3, 1, 2]])
+#   - a flat array + offsets:   lis_lengths_batch([10, 9, 2, 5, 3, 1, 2], offsets=[0, 4, 7])
+#     (sequence k is flat[offsets[k]:offsets[k + 1]])
+# Values must be comparable numbers; NaN is not supported (just like the
+# per-sequence function). Anything NumPy can't store exactly in a numeric array
+# (huge integers, mixed types) quietly takes the `bisect` path instead.
+
+# The arrays used for one group of sequences hold at most this many cells,
+# which keeps memory bounded no matter how big the batch is.
+_MAX_CELLS_PER_GROUP: int = 1 << 22
+
+# One lockstep step costs a few NumPy calls per binary-search bit, however many
+# sequences are still running. With fewer than this many sequences per bit,
+# `bisect` is cheaper, so those sequences are handed over to it (measured on NumPy 2.x).
+_MIN_LOCKSTEP_ROWS_PER_BIT: int = 64
+
+
+def _lockstep_pays_off(rows: int, step: int) -> bool:
+    """
+    Whether `rows` sequences at lockstep step `step` are enough to beat `bisect`.
+    """
+    return rows >= _MIN_LOCKSTEP_ROWS_PER_BIT * max(1, step.bit_length())
+
+
+def _lis_length_bisect(nums: Sequence[Any], tails: Optional[List[Any]] = None) -> int:
+    """
+    Patience sorting with `bisect_left` instead of a hand-written binary search.
+    `tails` lets the lockstep path hand over a sequence it has already started.
+    """
+    if tails is None:
+        tails = []
+    for num in nums:
+        insertion_point: int = bisect_left(tails, num)
+        if insertion_point == len(tails):
+            tails.append(num)
+        else:
+            tails[insertion_point] = num
+    return len(tails)
+
+
+def _lis_lengths_numpy(flat: "np.ndarray", offsets: "np.ndarray") -> "np.ndarray":
+    """
+    LIS length of every sequence `flat[offsets[k]:offsets[k + 1]]`, computed in lockstep.
+    """
+    num_sequences: int = len(offsets) - 1
+    lengths = np.diff(offsets)
+    result = np.zeros(num_sequences, dtype=np.int64)
+
+    # Longest sequences first: at step `t` the sequences still running are then
+    # always the first `k` rows, so we can slice `[:k]` instead of masking.
+    order = np.argsort(-lengths, kind="stable")
+
+    group_start: int = 0
+    while group_start < num_sequences:
+        longest: int = int(lengths[order[group_start]])
+        if longest == 0:
+            break  # The rest are empty sequences, whose LIS length is 0.
+
+        # Take as many sequences as fit in the cell budget (always at least one).
+        group_size: int = max(1, _MAX_CELLS_PER_GROUP // longest)
+        group = order[group_start:group_start + group_size]
+        group_start += len(group)
+        group_lengths = lengths[group]
+        rows: int = len(group)
+
+        if not _lockstep_pays_off(rows, longest):
+            # A few (long) sequences: plain `bisect` is faster than setting up lockstep.
+            for r in range(rows):
+                first: int = int(offsets[group[r]])
+                result[group[r]] = _lis_length_bisect(flat[first:first + int(group_lengths[r])].tolist())
+            continue
+
+        # `values[t, r]` is the t-th number of the r-th sequence in this group.
+        # Storing step `t` as one contiguous row makes `values[t, :k]` cheap.
+        # Cells past a sequence's end are never read, so they can stay uninitialized.
+        steps = np.arange(longest)
+        values = np.empty((longest, rows), dtype=flat.dtype)
+        inside = steps[:, None] < group_lengths[None, :]
+        values[inside] = flat[(offsets[group][None, :] + steps[:, None])[inside]]
+
+        # Sequence r keeps its sorted `tails` list in
+        # `tails[row_start[r]:row_start[r] + tail_count[r]]` of one flat array.
+        tails = np.empty(rows * longest, dtype=flat.dtype)
+        row_start = np.arange(rows, dtype=np.int64) * longest
+        tail_count = np.zeros(rows, dtype=np.int64)
+        # How many sequences are still running at each step (lengths are descending).
+        running = np.searchsorted(-group_lengths, -steps, side="left")
+
+        for t in range(longest):
+            k: int = int(running[t])
+            if not _lockstep_pays_off(k, t):
+                # Too few sequences left (e.g. one long outlier) for lockstep to pay off:
+                # finish each of them with `bisect`, starting from its current tails.
+                for r in range(k):
+                    sequence_tails = tails[row_start[r]:row_start[r] + tail_count[r]].tolist()
+                    rest = values[t:group_lengths[r], r].tolist()
+                    tail_count[r] = _lis_length_bisect(rest, sequence_tails)
+                break
+
+            v = values[t, :k]
+            count = tail_count[:k]
+            start = row_start[:k]
+
+            # Branchless binary search, one bit at a time: `position` ends up as the
+            # number of tails < v, which is exactly `bisect_left(tails, v)`.
+            # There are at most `t` tails, so `t.bit_length()` steps are enough.
+            position = np.zeros(k, dtype=np.int64)
+            step: int = 1 << t.bit_length() >> 1
+            while step:
+                candidate = position + step
+                # Clamp the index so we never read past the row; `candidate <= count`
+                # throws those reads away anyway.
+                probe = tails.take(start + np.minimum(candidate, longest) - 1)
+                position += step * ((candidate <= count) & (probe < v))
+                step >>= 1
+
+            tails[start + position] = v
+            # Appending (position == count) makes the LIS one longer.
+            count += position == count
+
+        result[group] = tail_count
+    return result
+
+
+def _lis_lengths_shard(flat: Any, offsets: Any) -> Any:
+    """
+    Computes one shard, picking the NumPy path when the data allows it.
+    Module-level so it can be sent to a worker process.
+    """
+    # Object arrays (e.g. integers too big for int64, or mixed types) and plain
+    # lists can't be compared in bulk, so they take the `bisect` path.
+    if np is not None and isinstance(flat, np.ndarray) and flat.dtype.kind in "iuf":
+        return _lis_lengths_numpy(flat, np.asarray(offsets, dtype=np.int64))
+    return [
+        _lis_length_bisect(flat[offsets[k]:offsets[k + 1]])
+        for k in range(len(offsets) - 1)
+    ]
+
+
+def _as_typed_array(flat: Any) -> Any:
+    """
+    Converts a flat list to a NumPy array, unless that would change any value.
+    """
+    if isinstance(flat, np.ndarray):
+        return flat
+    flat_array = np.asarray(flat)
+    # Anything but a numeric array means NumPy changed the values' type, e.g. mixing
+    # numbers and strings turns the numbers into strings, where the per-sequence
+    # function would raise TypeError. Keep the list, so `bisect` behaves the same.
+    if flat_array.dtype.kind not in "iuf":
+        return flat
+    # Mixing Python floats with integers above 2**53 gives a float array in which
+    # those integers are rounded, and rounding could change the LIS. Keep the list.
+    if flat_array.dtype.kind == "f" and flat_array.size and np.abs(flat_array).max() > 2 ** 53:
+        return flat
+    return flat_array
+
+
+def _flatten(sequences: Sequence[Sequence[Any]]) -> Tuple[List[Any], List[int]]:
+    """
+    Turns a list of lists into one flat list plus offsets.
+    """
+    offsets: List[int] = [0]
+    for sequence in sequences:
+        offsets.append(offsets[-1] + len(sequence))
+    return list(chain.from_iterable(sequences)), offsets
+
+
+def lis_lengths_batch(
+    sequences: Union[Sequence[Sequence[Any]], Sequence[Any]],
+    offsets: Optional[Sequence[int]] = None,
+    workers: int = 1,
+    shard_size: int = 10000,
+) -> Union["np.ndarray", List[int]]:
+    """
+    Calculates the length of the Longest Increasing Subsequence of many sequences.
+
+    Args:
+        sequences: Either a list of sequences, or (when `offsets` is given) one flat
+                   array holding all sequences back to back.
+        offsets: Optional start positions into the flat array, plus the final end
+                 position, so sequence k is `sequences[offsets[k]:offsets[k + 1]]`.
+        workers: Number of processes to spread the work over. 1 runs everything
+                 in this process.
+        shard_size: How many sequences each worker process gets at a time.
+
+    Returns:
+        The LIS length of each sequence, in input order: a NumPy int64 array
+        if NumPy is installed, otherwise a list of ints.
+
+    Raises:
+        ValueError: If `shard_size` is below 1, or `offsets` is empty, decreasing,
+                    or points outside the flat array.
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+    if offsets is None:
+        flat, offsets = _flatten(sequences)
+    else:
+        flat = sequences
+        # The NumPy path indexes `flat` directly, so unlike list slicing it would
+        # read the wrong numbers (or fail) for offsets that don't fit.
+        if len(offsets) == 0:
+            raise ValueError("offsets must contain at least one entry")
+        if offsets[0] < 0 or offsets[len(offsets) - 1] > len(flat):
+            raise ValueError("offsets must lie between 0 and len(sequences)")
+        if any(offsets[k] > offsets[k + 1] for k in range(len(offsets) - 1)):
+            raise ValueError("offsets must be non-decreasing")
+    if np is not None:
+        flat = _as_typed_array(flat)
+        offsets = np.asarray(offsets, dtype=np.int64)
+
+    num_sequences: int = len(offsets) - 1
+
+    if workers <= 1 or num_sequences <= shard_size:
+        lengths = _lis_lengths_shard(flat, offsets)
+    else:
+        # Each shard gets its own slice of the flat array, with offsets rebased to 0,
+        # so only that slice is sent to the worker process.
+        shards: List[Tuple[Any, Any]] = []
+        for first in range(0, num_sequences, shard_size):
+            last: int = min(first + shard_size, num_sequences)
+            start, end = offsets[first], offsets[last]
+            shard_offsets = offsets[first:last + 1]
+            if np is not None:
+                shard_offsets = shard_offsets - start
+            else:
+                shard_offsets = [offset - start for offset in shard_offsets]
+            shards.append((flat[start:end], shard_offsets))
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            shard_results = list(pool.map(_lis_lengths_shard, *zip(*shards)))
+        lengths = list(chain.from_iterable(shard_results))
+
+    if np is not None:
+        return np.asarray(lengths, dtype=np.int64)
+    return list(lengths)
+
+
+# ======================================================================================
+# Example
+# ======================================================================================
+if __name__ == "__main__":
+    import random
+    import time
+
+    from longest_increasing_subsequence import longest_increasing_subsequence_optimized_nlogn
+
+    print("--- Batched Longest Increasing Subsequence ---")
+    print(f"NumPy available: {np is not None}")
+
+    small_batch = lis_lengths_batch([[10, 9, 2, 5, 3, 7, 101, 18], [0, 1, 0, 3, 2, 3], [], [7, 7, 7]])
+    print(f"\nSmall batch: {[int(length) for length in small_batch]}")
+    flat_batch = lis_lengths_batch([10, 9, 2, 5, 3, 1, 2], offsets=[0, 4, 7])
+    print(f"Flat + offsets: {[int(length) for length in flat_batch]}")
+
+    random.seed(0)
+    batches: List[Tuple[str, List[List[float]]]] = [
+        ("5000 random price series", [
+            [round(random.uniform(0, 100), 1) for _ in range(random.randint(0, 300))]
+            for _ in range(5000)
+        ]),
+        # Few but long series: here lockstep can't pay off, and `bisect` takes over.
+        ("3 long price series", [
+            [round(random.uniform(0, 100), 1) for _ in range(20000)]
+            for _ in range(3)
+        ]),
+    ]
+
+    for description, batch in batches:
+        start = time.perf_counter()
+        expected: List[int] = [longest_increasing_subsequence_optimized_nlogn(prices) for prices in batch]
+        one_by_one_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = lis_lengths_batch(batch)
+        batched_seconds = time.perf_counter() - start
+
+        sharded = lis_lengths_batch(batch, workers=2, shard_size=1000)
+
+        print(f"\n{description}:")
+        print(f"  One by one: {one_by_one_seconds:.3f}s")
+        print(f"  Batched:    {batched_seconds:.3f}s")
+        assert list(batched) == expected, "Batched LIS lengths differ from the per-sequence function"
+        assert list(sharded) == expected, "Sharded LIS lengths differ from the per-sequence function"
+
+    print("\nAll batched LIS results match the per-sequence function!")
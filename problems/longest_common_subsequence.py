@@ -1,4 +1,4 @@
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 
 # --- Problem: Longest Common Subsequence (LCS) ---
 # Given two strings, find the length of the longest subsequence present in both of them.
@@ -80,7 +80,11 @@ def longest_common_subsequence_memoization(s1: str, s2: str) -> int:
 # Approach 2: Tabulation (Bottom-Up Dynamic Programming)
 # ======================================================================================
 
-def longest_common_subsequence_tabulation(s1: str, s2: str) -> int:
+def longest_common_subsequence_tabulation(
+    s1: str,
+    s2: str,
+    row_checkpoint: Optional[Callable[[int, List[int]], None]] = None
+) -> int:
     """
     Calculates the length of the Longest Common Subsequence of two strings
     using the tabulation (bottom-up) dynamic programming approach.
@@ -88,6 +92,10 @@ def longest_common_subsequence_tabulation(s1: str, s2: str) -> int:
     Args:
         s1: The first string.
         s2: The second string.
+        row_checkpoint: Optional function called as `row_checkpoint(i, dp[i])` after
+                        each row of the table is filled. `dp[i][n]` is the LCS length
+                        of s1[0...i-1] and s2, a lower bound on the final answer, so the
+                        caller can watch progress, or raise an exception to stop early.
 
     Returns:
         The length of the LCS.
@@ -98,12 +106,15 @@ def longest_common_subsequence_tabulation(s1: str, s2: str) -> int:
     # Create a DP table `dp[i][j]` which will store the length of LCS
     # of s1[0...i-1] and s2[0...j-1].
     # The table size is (m+1) x (n+1) to handle base cases (empty strings).
-    dp: List[List[int]] = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
+    # Each row is added right before it is filled, so a huge table isn't built
+    # up front (and `row_checkpoint` is reached right away).
+    dp: List[List[int]] = []
 
     # Fill the dp table in a bottom-up manner.
     # i iterates through characters of s1 (from 1 to m)
     # j iterates through characters of s2 (from 1 to n)
     for i in range(m + 1):
+        dp.append([0] * (n + 1))
         for j in range(n + 1):
             if i == 0 or j == 0:
                 # Base case: If one of the strings is empty, LCS is 0.
@@ -118,6 +129,10 @@ def longest_common_subsequence_tabulation(s1: str, s2: str) -> int:
                 # 2. LCS of s1[0...i-1] and s2[0...j-2] (excluding char from s2)
                 dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
 
+        # Row `i` is finished: a good moment to report progress (see async_solvers.py).
+        if row_checkpoint is not None:
+            row_checkpoint(i, dp[i])
+
     # The value at dp[m][n] contains the length of LCS for s1 and s2.
     return dp[m][n]
 
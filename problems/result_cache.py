@@ -0,0 +1,253 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+# --- Result Cache: remembering answers across calls, processes and restarts ---
+# The memoization in this folder (`memo_pad` in fibonacci.py, the `memo` dict in
+# longest_common_subsequence.py) lives in memory and disappears when the call or
+# the program ends. That's perfect for subproblems inside ONE solve.
+#
+# This module remembers whole answers instead, in a small SQLite file on disk:
+#   - The key is a SHA-256 hash of (solver name, solver version, inputs), written
+#     as canonical JSON, so the same instance always gets the same key.
+#   - Several processes can read and write the same file at once (SQLite's
+#     write-ahead log lets readers and a writer work side by side).
+#   - The file has a size budget. When it is exceeded, the least recently used
+#     entries are thrown away first.
+#
+# Seeing the same instance again then costs one lookup instead of a full DP.
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS results (
+    key       TEXT PRIMARY KEY,
+    value     TEXT NOT NULL,
+    size      INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+CREATE TABLE IF NOT EXISTS stats (
+    id          INTEGER PRIMARY KEY CHECK (id = 0),
+    total_bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (id, total_bytes) VALUES (0, 0);
+"""
+
+# Refreshing `last_used` on every hit would turn every read into a write.
+# Entries used within this many seconds are considered "fresh enough".
+_TOUCH_INTERVAL_SECONDS: float = 60.0
+
+# After an eviction the cache is trimmed down to this fraction of its budget,
+# so we don't have to evict again on the very next insert.
+_EVICT_TO_FRACTION: float = 0.9
+
+
+def make_cache_key(solver: str, version: str, inputs: Any) -> str:
+    """
+    Builds the canonical key for one problem instance.
+
+    Args:
+        solver: Name of the solver, e.g. "lcs".
+        version: Version of the solver. Bump it when the solver's answers change,
+                 so old cached answers are no longer used.
+        inputs: The solver's inputs. Must be JSON-serializable.
+
+    Returns:
+        A hex SHA-256 digest. Dict keys are sorted and whitespace is removed,
+        so equal inputs always give equal keys.
+    """
+    # `ensure_ascii=True` escapes every non-ASCII character (lone surrogates included),
+    # so the text always encodes cleanly and stays canonical.
+    canonical: str = json.dumps(
+        [solver, version, inputs], sort_keys=True, separators=(",", ":"), ensure_ascii=True
+    )
+    return hashlib.sha256(canonical.encode("ascii")).hexdigest()
+
+
+class ResultCache:
+    """
+    A persistent, size-bounded cache of solver results backed by SQLite.
+
+    Example:
+        cache = ResultCache("results.sqlite3", max_bytes=64 * 1024 * 1024)
+        length = cache.get_or_compute("lcs", "1", {"s1": s1, "s2": s2},
+                                      lambda: longest_common_subsequence_tabulation(s1, s2))
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024) -> None:
+        """
+        Args:
+            path: Location of the SQLite file. It is created if it does not exist.
+            max_bytes: Size budget for the stored keys and values.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        self.path: str = path
+        self.max_bytes: int = max_bytes
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Returns this process's connection, opening it on first use.
+        SQLite connections must not be shared across `fork()`, so a child
+        process notices the different pid and opens its own.
+        """
+        if self._connection is None or self._connection_pid != os.getpid():
+            # `timeout` makes a writer wait (instead of failing) while another
+            # process holds the write lock. `isolation_level=None` lets us
+            # control transactions ourselves with BEGIN / COMMIT.
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached value for `key`, or None if it is not cached.
+        """
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT value, last_used FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value_json, last_used = row
+
+        now: float = time.time()
+        if now - last_used > _TOUCH_INTERVAL_SECONDS:
+            connection.execute("UPDATE results SET last_used = ? WHERE key = ?", (now, key))
+        return json.loads(value_json)
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Stores `value` (which must be JSON-serializable and not None) under `key`,
+        evicting least recently used entries if the size budget is exceeded.
+        """
+        if value is None:
+            raise ValueError("None cannot be cached, it means 'not found' in get()")
+        value_json: str = json.dumps(value, separators=(",", ":"))
+        size: int = len(key) + len(value_json.encode("utf-8"))
+        if size > self.max_bytes:
+            # Storing it would immediately evict everything else, including itself.
+            return
+
+        connection = self._connect()
+        # BEGIN IMMEDIATE takes the write lock up front, so the size bookkeeping
+        # below can't be interleaved with another process's insert or eviction.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            old = connection.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            if old is not None:
+                connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                connection.execute("UPDATE stats SET total_bytes = total_bytes - ? WHERE id = 0", (old[0],))
+            connection.execute(
+                "INSERT INTO results (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, value_json, size, time.time()),
+            )
+            connection.execute("UPDATE stats SET total_bytes = total_bytes + ? WHERE id = 0", (size,))
+            self._evict_if_needed(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _evict_if_needed(self, connection: sqlite3.Connection) -> None:
+        """
+        Deletes the least recently used entries until the cache is back under budget.
+        Must be called inside a write transaction.
+        """
+        total_bytes: int = connection.execute("SELECT total_bytes FROM stats WHERE id = 0").fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return
+
+        target_bytes: int = int(self.max_bytes * _EVICT_TO_FRACTION)
+        freed_bytes: int = 0
+        doomed_keys: List[Tuple[str]] = []
+        for key, size in connection.execute("SELECT key, size FROM results ORDER BY last_used"):
+            if total_bytes - freed_bytes <= target_bytes:
+                break
+            doomed_keys.append((key,))
+            freed_bytes += size
+
+        connection.executemany("DELETE FROM results WHERE key = ?", doomed_keys)
+        connection.execute("UPDATE stats SET total_bytes = total_bytes - ? WHERE id = 0", (freed_bytes,))
+
+    def lookup(self, solver: str, version: str, inputs: Any) -> Optional[Any]:
+        """
+        Shortcut for `get(make_cache_key(solver, version, inputs))`.
+        """
+        return self.get(make_cache_key(solver, version, inputs))
+
+    def get_or_compute(self, solver: str, version: str, inputs: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the cached result for this instance, or calls `compute()`,
+        stores its result and returns it.
+        """
+        key: str = make_cache_key(solver, version, inputs)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        result = compute()
+        self.put(key, result)
+        return result
+
+    def total_bytes(self) -> int:
+        """
+        Returns how many bytes of keys and values are currently stored.
+        """
+        return self._connect().execute("SELECT total_bytes FROM stats WHERE id = 0").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Closes this process's connection. The cache reopens it if used again.
+        """
+        if self._connection is not None and self._connection_pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._connection_pid = None
+
+
+# ======================================================================================
+# Example
+# ======================================================================================
+if __name__ == "__main__":
+    import tempfile
+
+    from longest_common_subsequence import longest_common_subsequence_tabulation
+
+    print("--- Persistent Result Cache ---")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResultCache(os.path.join(temp_dir, "results.sqlite3"), max_bytes=1024)
+
+        s1, s2 = "AGGTAB" * 50, "GXTXAYB" * 50
+        start = time.perf_counter()
+        first = cache.get_or_compute("lcs", "1", {"s1": s1, "s2": s2},
+                                     lambda: longest_common_subsequence_tabulation(s1, s2))
+        first_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        second = cache.get_or_compute("lcs", "1", {"s1": s1, "s2": s2},
+                                      lambda: longest_common_subsequence_tabulation(s1, s2))
+        second_seconds = time.perf_counter() - start
+
+        print(f"  First call (computed): {first} in {first_seconds * 1000:.2f} ms")
+        print(f"  Second call (cached):  {second} in {second_seconds * 1000:.2f} ms")
+        assert first == second
+
+        # Fill the cache past its 1 KB budget; the oldest entries get evicted.
+        for n in range(100):
+            cache.put(make_cache_key("fibonacci", "1", {"number": n}), n)
+        print(f"  Bytes stored after 100 inserts: {cache.total_bytes()} (budget {cache.max_bytes})")
+        assert cache.total_bytes() <= cache.max_bytes
+        assert cache.lookup("fibonacci", "1", {"number": 99}) == 99
+        assert cache.lookup("fibonacci", "1", {"number": 0}) is None
+        cache.close()
+
+    print("\nResult cache example finished successfully!")